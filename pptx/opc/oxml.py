@@ -2,10 +2,16 @@
 
 """OPC-local oxml module to handle OPC-local concerns like relationship parsing."""
 
+import re
+from xml.sax.saxutils import escape
+
 from lxml import etree
 
 from .constants import NAMESPACE as NS, RELATIONSHIP_TARGET_MODE as RTM
-from ..oxml import parse_xml, register_element_cls
+from ..compat import BytesIO, is_unicode
+from ..exc import InvalidXmlError
+from ..oxml import register_element_cls
+from ..oxml.ns import qn
 from ..oxml.simpletypes import (
     ST_ContentType,
     ST_Extension,
@@ -16,6 +22,7 @@ from ..oxml.simpletypes import (
 from ..oxml.xmlchemy import (
     BaseOxmlElement,
     OptionalAttribute,
+    OxmlElement,
     RequiredAttribute,
     ZeroOrMore,
 )
@@ -28,12 +35,93 @@ nsmap = {
 }
 
 
+def iter_content_types(content_types_xml):
+    """Generate (tag, key, content_type) triple for each item in `content_types_xml`.
+
+    `tag` is "Default" or "Override" and `key` is the extension or partname the
+    content-type applies to, respectively. The XML is parsed incrementally and each
+    element is discarded once read, so a large `[Content_Types].xml` item is never held
+    in memory as a complete tree. Raises |InvalidXmlError| when an item is missing a
+    required attribute.
+    """
+
+    def required_attr(elm, attr_name):
+        value = elm.get(attr_name)
+        if value is None:
+            raise InvalidXmlError(
+                "required '%s' attribute not present on element %s"
+                % (attr_name, elm.tag)
+            )
+        return value
+
+    if is_unicode(content_types_xml):
+        content_types_xml = content_types_xml.encode("utf-8")
+    default_tag, override_tag = qn("ct:Default"), qn("ct:Override")
+
+    for _, elm in etree.iterparse(
+        BytesIO(content_types_xml),
+        tag=(default_tag, override_tag),
+        resolve_entities=False,
+    ):
+        if elm.tag == default_tag:
+            tag, key = "Default", required_attr(elm, "Extension")
+        else:
+            tag, key = "Override", required_attr(elm, "PartName")
+        yield tag, key, required_attr(elm, "ContentType")
+        # --- release this element and any already-processed siblings ---
+        elm.clear()
+        while elm.getprevious() is not None:
+            del elm.getparent()[0]
+
+
 def oxml_tostring(elm, encoding=None, pretty_print=False, standalone=None):
     return etree.tostring(
         elm, encoding=encoding, pretty_print=pretty_print, standalone=standalone
     )
 
 
+# --- any character outside the XML 1.0 `Char` production ---
+_invalid_xml_char_re = re.compile(
+    "[^\u0009\u000A\u000D\u0020-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]"
+)
+# --- escapes lxml applies to attribute values beyond the `&`, `<`, and `>` ---
+_attr_entities = {'"': "&quot;", "\t": "&#9;", "\n": "&#10;", "\r": "&#13;"}
+_rels_xml_root = '<Relationships xmlns="%s"' % NS.OPC_RELATIONSHIPS
+_rels_xml_decl = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+
+
+def serialize_rels_xml(rel_items):
+    """Return bytes .rels XML for `rel_items` composed without building an element tree.
+
+    `rel_items` is a sequence of (rId, reltype, target_ref, is_external) tuples. The
+    result is byte-for-byte the same as `CT_Relationships.xml` for the same items.
+    When any value contains a character XML cannot represent, the XML is composed
+    using `CT_Relationships` instead so lxml raises exactly as it otherwise would.
+    """
+    if any(_invalid_xml_char_re.search(v) for item in rel_items for v in item[:3]):
+        rels_elm = CT_Relationships.new()
+        for rId, reltype, target_ref, is_external in rel_items:
+            rels_elm.add_rel(rId, reltype, target_ref, is_external)
+        return rels_elm.xml
+
+    if not rel_items:
+        return ("%s%s/>" % (_rels_xml_decl, _rels_xml_root)).encode("utf-8")
+
+    fragments = [_rels_xml_decl, _rels_xml_root, ">"]
+    for rId, reltype, target_ref, is_external in rel_items:
+        fragments.append(
+            '<Relationship Id="%s" Type="%s" Target="%s"%s/>'
+            % (
+                escape(rId, _attr_entities),
+                escape(reltype, _attr_entities),
+                escape(target_ref, _attr_entities),
+                ' TargetMode="External"' if is_external else "",
+            )
+        )
+    fragments.append("</Relationships>")
+    return "".join(fragments).encode("utf-8")
+
+
 def serialize_part_xml(part_elm):
     xml = etree.tostring(part_elm, encoding="UTF-8", standalone=True)
     return xml
@@ -75,8 +163,7 @@ class CT_Relationship(BaseOxmlElement):
         """
         Return a new ``<Relationship>`` element.
         """
-        xml = '<Relationship xmlns="%s"/>' % nsmap["pr"]
-        relationship = parse_xml(xml)
+        relationship = OxmlElement("pr:Relationship", nsmap={None: nsmap["pr"]})
         relationship.rId = rId
         relationship.reltype = reltype
         relationship.target_ref = target
@@ -101,7 +188,7 @@ class CT_Relationships(BaseOxmlElement):
     @classmethod
     def new(cls):
         """Return a new ``<Relationships>`` element."""
-        return parse_xml('<Relationships xmlns="%s"/>' % nsmap["pr"])
+        return OxmlElement("pr:Relationships", nsmap={None: nsmap["pr"]})
 
     @property
     def xml(self):
@@ -140,9 +227,7 @@ class CT_Types(BaseOxmlElement):
         """
         Return a new ``<Types>`` element.
         """
-        xml = '<Types xmlns="%s"/>' % nsmap["ct"]
-        types = parse_xml(xml)
-        return types
+        return OxmlElement("ct:Types", nsmap={None: nsmap["ct"]})
 
 
 register_element_cls("ct:Default", CT_Default)
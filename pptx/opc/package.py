@@ -7,10 +7,19 @@ presentations to and from a .pptx file.
 """
 
 import collections
+import functools
+import itertools
+import re
+import sys
 
-from pptx.compat import is_string, Mapping
+from pptx.compat import BytesIO, is_string, Mapping
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM, RELATIONSHIP_TYPE as RT
-from pptx.opc.oxml import CT_Relationships, serialize_part_xml
+from pptx.opc.oxml import (
+    CT_Relationships,
+    iter_content_types,
+    serialize_part_xml,
+    serialize_rels_xml,
+)
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
 from pptx.opc.serialized import PackageReader, PackageWriter
 from pptx.opc.shared import CaseInsensitiveDict
@@ -66,6 +75,9 @@ class OpcPackage(_RelatableMixin):
 
     def __init__(self, pkg_file):
         self._pkg_file = pkg_file
+        # --- (mutation_token, items) pairs caching the last rels-graph traversal ---
+        self._parts_cache = (None, ())
+        self._rels_cache = (None, ())
 
     @classmethod
     def open(cls, pkg_file):
@@ -77,43 +89,26 @@ class OpcPackage(_RelatableMixin):
         self._rels.pop(rId)
 
     def iter_parts(self):
-        """Generate exactly one reference to each part in the package."""
-        visited = set()
-        for rel in self.iter_rels():
-            if rel.is_external:
-                continue
-            part = rel.target_part
-            if part in visited:
-                continue
-            yield part
-            visited.add(part)
+        """Return iterator over exactly one reference to each part in the package.
 
-    def iter_rels(self):
-        """Generate exactly one reference to each relationship in package.
-
-        Performs a depth-first traversal of the rels graph.
+        The parts are collected by a traversal of the rels graph that is cached and only
+        repeated once a relationship has been added or removed anywhere in the process,
+        not only in this package.
         """
-        visited = set()
+        mutation_token = _Relationships.mutation_token
+        if self._parts_cache[0] != mutation_token:
+            self._parts_cache = (mutation_token, tuple(self._iter_parts()))
+        return iter(self._parts_cache[1])
 
-        def walk_rels(rels):
-            for rel in rels:
-                yield rel
-                # --- external items can have no relationships ---
-                if rel.is_external:
-                    continue
-                # --- all relationships other than those for the package belong to a
-                # --- part. Once that part has been processed, processing it again
-                # --- would lead to the same relationships appearing more than once.
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.add(part)
-                # --- recurse into relationships of each unvisited target-part ---
-                for rel in walk_rels(part.rels):
-                    yield rel
+    def iter_rels(self):
+        """Return iterator over exactly one reference to each relationship in package.
 
-        for rel in walk_rels(self._rels):
-            yield rel
+        Like `.iter_parts()`, the traversal is cached until the rels graph changes.
+        """
+        mutation_token = _Relationships.mutation_token
+        if self._rels_cache[0] != mutation_token:
+            self._rels_cache = (mutation_token, tuple(self._iter_rels()))
+        return iter(self._rels_cache[1])
 
     @property
     def main_document_part(self):
@@ -133,14 +128,15 @@ class OpcPackage(_RelatableMixin):
         # --- expected next partname is tmpl % n where n is one greater than the number
         # --- of existing partnames that match tmpl. Speed up finding the next one
         # --- (maybe) by searching from the end downward rather than from 1 upward.
-        prefix = tmpl[: (tmpl % 42).find("42")]
-        partnames = set(
-            p.partname for p in self.iter_parts() if p.partname.startswith(prefix)
-        )
-        for n in range(len(partnames) + 1, 0, -1):
-            candidate_partname = tmpl % n
-            if candidate_partname not in partnames:
-                return PackURI(candidate_partname)
+        prefix, suffix, partname_re = _partname_tmpl_parts(tmpl)
+        idxs = set()
+        for part in self.iter_parts():
+            match = partname_re.match(part.partname)
+            if match is not None:
+                idxs.add(int(match.group(1)))
+        for n in range(len(idxs) + 1, 0, -1):
+            if n not in idxs:
+                return PackURI(f"{prefix}{n}{suffix}")
         raise Exception(  # pragma: no cover
             "ProgrammingError: ran out of candidate_partnames"
         )
@@ -152,6 +148,48 @@ class OpcPackage(_RelatableMixin):
         """
         PackageWriter.write(pkg_file, self._rels, tuple(self.iter_parts()))
 
+    def _iter_parts(self):
+        """Generate exactly one reference to each part in the package."""
+        visited = set()
+        for rel in self.iter_rels():
+            if rel.is_external:
+                continue
+            part = rel.target_part
+            if part in visited:
+                continue
+            yield part
+            visited.add(part)
+
+    def _iter_rels(self):
+        """Generate exactly one reference to each relationship in package.
+
+        Performs a depth-first traversal of the rels graph. An explicit stack of
+        rels iterators is used rather than recursion so each relationship is produced
+        in constant time regardless of how deep in the graph it appears.
+        """
+        visited = set()
+        rels_iters = [iter(self._rels)]
+
+        while rels_iters:
+            rel = next(rels_iters[-1], None)
+            # --- this rels collection is exhausted, resume with its parent's ---
+            if rel is None:
+                rels_iters.pop()
+                continue
+            yield rel
+            # --- external items can have no relationships ---
+            if rel.is_external:
+                continue
+            # --- all relationships other than those for the package belong to a
+            # --- part. Once that part has been processed, processing it again
+            # --- would lead to the same relationships appearing more than once.
+            part = rel.target_part
+            if part in visited:
+                continue
+            visited.add(part)
+            # --- descend into relationships of each unvisited target-part ---
+            rels_iters.append(iter(part.rels))
+
     def _load(self):
         """Return the package after loading all parts and relationships."""
         pkg_xml_rels, parts = _PackageLoader.load(self._pkg_file, self)
@@ -371,6 +409,11 @@ class Part(_RelatableMixin):
             with open(file, "rb") as f:
                 return f.read()
 
+        # --- an in-memory stream already holds the full blob, return it directly
+        # --- rather than copying it out through a seek() and read().
+        if isinstance(file, BytesIO):
+            return file.getvalue()
+
         # --- otherwise, assume `file` is a file-like object
         # --- reposition file cursor if it has one
         if callable(getattr(file, "seek")):
@@ -379,7 +422,7 @@ class Part(_RelatableMixin):
 
     def _rel_ref_count(self, rId):
         """Return int count of references in this part's XML to `rId`."""
-        return len([r for r in self._element.xpath("//@r:id") if r == rId])
+        return int(self._element.xpath("count(//@r:id[.=$rId])", rId=rId))
 
     @lazyproperty
     def _rels(self):
@@ -438,9 +481,7 @@ class PartFactory(object):
 
         Returns |Part| if no custom class is registered for `content_type`.
         """
-        if content_type in cls.part_type_for:
-            return cls.part_type_for[content_type]
-        return Part
+        return cls.part_type_for.get(content_type, Part)
 
 
 class _ContentTypeMap(object):
@@ -471,13 +512,14 @@ class _ContentTypeMap(object):
     @classmethod
     def from_xml(cls, content_types_xml):
         """Return |_ContentTypeMap| instance populated from `content_types_xml`."""
-        types_elm = parse_xml(content_types_xml)
-        overrides = CaseInsensitiveDict(
-            (o.partName.lower(), o.contentType) for o in types_elm.override_lst
-        )
-        defaults = CaseInsensitiveDict(
-            (d.extension.lower(), d.contentType) for d in types_elm.default_lst
-        )
+        overrides, defaults = CaseInsensitiveDict(), CaseInsensitiveDict()
+        for tag, key, content_type in iter_content_types(content_types_xml):
+            # --- the same few content-types are repeated across many items ---
+            content_type = sys.intern(content_type)
+            if tag == "Default":
+                defaults[key] = content_type
+            else:
+                overrides[key] = content_type
         return cls(overrides, defaults)
 
 
@@ -492,8 +534,17 @@ class _Relationships(Mapping):
     not rIds (keys) as it would for a dict.
     """
 
+    # --- replaced with a fresh value whenever a relationship is added to or removed
+    # --- from any collection. Lets a package cache a traversal of its rels graph until
+    # --- that graph (or any other) changes. Values are drawn from a counter so a token
+    # --- is never reused, even when collections are changed on separate threads.
+    _mutation_tokens = itertools.count(1)
+    mutation_token = 0
+
     def __init__(self, base_uri):
         self._base_uri = base_uri
+        # --- {reltype: [rels]} index, built on first use then kept current ---
+        self._reltype_index = None
 
     def __contains__(self, rId):
         """Implement 'in' operation, like `"rId7" in relationships`."""
@@ -559,6 +610,8 @@ class _Relationships(Mapping):
 
         self._rels.clear()
         self._rels.update((rel.rId, rel) for rel in iter_valid_rels())
+        self._reltype_index = None
+        _Relationships.mutation_token = next(_Relationships._mutation_tokens)
 
     def part_with_reltype(self, reltype):
         """Return target part of relationship with matching `reltype`.
@@ -583,7 +636,11 @@ class _Relationships(Mapping):
 
         The caller is responsible for ensuring it is no longer required.
         """
-        return self._rels.pop(rId)
+        rel = self._rels.pop(rId)
+        if self._reltype_index is not None:
+            self._reltype_index[rel.reltype].remove(rel)
+        _Relationships.mutation_token = next(_Relationships._mutation_tokens)
+        return rel
 
     @property
     def xml(self):
@@ -592,21 +649,23 @@ class _Relationships(Mapping):
         This value is suitable for storage as a .rels file in an OPC package. Includes
         a `<?xml` header with encoding as UTF-8.
         """
-        rels_elm = CT_Relationships.new()
-        for rel in self:
-            rels_elm.add_rel(rel.rId, rel.reltype, rel.target_ref, rel.is_external)
-        return rels_elm.xml
+        return serialize_rels_xml(
+            [(rel.rId, rel.reltype, rel.target_ref, rel.is_external) for rel in self]
+        )
 
     def _add_relationship(self, reltype, target, is_external=False):
         """Return str rId of |_Relationship| newly added to spec."""
         rId = self._next_rId
-        self._rels[rId] = _Relationship(
+        rel = self._rels[rId] = _Relationship(
             self._base_uri,
             rId,
-            reltype,
+            sys.intern(reltype),
             target_mode=RTM.EXTERNAL if is_external else RTM.INTERNAL,
             target=target,
         )
+        if self._reltype_index is not None:
+            self._reltype_index[rel.reltype].append(rel)
+        _Relationships.mutation_token = next(_Relationships._mutation_tokens)
         return rId
 
     def _get_matching(self, reltype, target, is_external=False):
@@ -635,7 +694,7 @@ class _Relationships(Mapping):
         # --- used and the next available rId is "rId%d" % (len(rels)+1). So we start
         # --- there and count down to produce the best performance.
         for n in range(len(self) + 1, 0, -1):
-            rId_candidate = "rId%d" % n  # like 'rId19'
+            rId_candidate = f"rId{n}"  # like 'rId19'
             if rId_candidate not in self._rels:
                 return rId_candidate
 
@@ -646,16 +705,24 @@ class _Relationships(Mapping):
 
     @property
     def _rels_by_reltype(self):
-        """defaultdict {reltype: [rels]} for all relationships in collection."""
-        D = collections.defaultdict(list)
-        for rel in self:
-            D[rel.reltype].append(rel)
-        return D
+        """defaultdict {reltype: [rels]} for all relationships in collection.
+
+        The index is built on first access and updated as relationships are added and
+        removed, so a reltype lookup does not re-scan the whole collection.
+        """
+        if self._reltype_index is None:
+            D = collections.defaultdict(list)
+            for rel in self:
+                D[rel.reltype].append(rel)
+            self._reltype_index = D
+        return self._reltype_index
 
 
 class _Relationship(object):
     """Value object describing link from a part or package to another part."""
 
+    __slots__ = ("_base_uri", "_rId", "_reltype", "_target_mode", "_target")
+
     def __init__(self, base_uri, rId, reltype, target_mode, target):
         self._base_uri = base_uri
         self._rId = rId
@@ -671,9 +738,10 @@ class _Relationship(object):
             if rel.targetMode == RTM.EXTERNAL
             else parts[PackURI.from_rel_ref(base_uri, rel.target_ref)]
         )
-        return cls(base_uri, rel.rId, rel.reltype, rel.targetMode, target)
+        # --- each reltype is repeated across many relationships in a package ---
+        return cls(base_uri, rel.rId, sys.intern(rel.reltype), rel.targetMode, target)
 
-    @lazyproperty
+    @property
     def is_external(self):
         """True if target_mode is `RTM.EXTERNAL`.
 
@@ -682,12 +750,12 @@ class _Relationship(object):
         """
         return self._target_mode == RTM.EXTERNAL
 
-    @lazyproperty
+    @property
     def reltype(self):
         """Member of RELATIONSHIP_TYPE describing relationship of target to source."""
         return self._reltype
 
-    @lazyproperty
+    @property
     def rId(self):
         """str relationship-id, like 'rId9'.
 
@@ -697,7 +765,7 @@ class _Relationship(object):
         """
         return self._rId
 
-    @lazyproperty
+    @property
     def target_part(self):
         """|Part| or subtype referred to by this relationship."""
         if self.is_external:
@@ -707,7 +775,7 @@ class _Relationship(object):
             )
         return self._target
 
-    @lazyproperty
+    @property
     def target_partname(self):
         """|PackURI| instance containing partname targeted by this relationship.
 
@@ -721,7 +789,7 @@ class _Relationship(object):
             )
         return self._target.partname
 
-    @lazyproperty
+    @property
     def target_ref(self):
         """str reference to relationship target.
 
@@ -733,3 +801,18 @@ class _Relationship(object):
             if self.is_external
             else self.target_partname.relative_ref(self._base_uri)
         )
+
+
+@functools.lru_cache(maxsize=None)
+def _partname_tmpl_parts(tmpl):
+    """Return (prefix, suffix, partname_re) triple for partname template `tmpl`.
+
+    `tmpl` is a partname template like "/ppt/slides/slide%d.xml", for which `prefix` is
+    "/ppt/slides/slide" and `suffix` is ".xml". `partname_re` is a compiled regex
+    matching partnames generated by `tmpl`, capturing their integer portion as group 1.
+    """
+    prefix, _, suffix = tmpl.partition("%d")
+    partname_re = re.compile(
+        "%s([1-9][0-9]*)%s$" % (re.escape(prefix), re.escape(suffix))
+    )
+    return prefix, suffix, partname_re
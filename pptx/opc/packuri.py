@@ -5,6 +5,8 @@
 import posixpath
 import re
 
+from pptx.util import lazyproperty
+
 
 class PackURI(str):
     """Proxy for a pack URI (partname).
@@ -30,7 +32,7 @@ class PackURI(str):
         abs_uri = posixpath.abspath(joined_uri)
         return PackURI(abs_uri)
 
-    @property
+    @lazyproperty
     def baseURI(self):
         """
         The base URI of this pack URI, the directory portion, roughly
@@ -92,12 +94,18 @@ class PackURI(str):
         *baseURI*. E.g. PackURI('/ppt/slideLayouts/slideLayout1.xml') would
         return '../slideLayouts/slideLayout1.xml' for baseURI '/ppt/slides'.
         """
-        # workaround for posixpath bug in 2.6, doesn't generate correct
-        # relative path when *start* (second) parameter is root ('/')
-        if baseURI == "/":
-            relpath = self[1:]
-        else:
-            relpath = posixpath.relpath(self, baseURI)
+        # --- a partname is typically referenced from many parts sharing the same
+        # --- baseURI, so each result is computed only once.
+        relative_refs = self._relative_refs
+        relpath = relative_refs.get(baseURI)
+        if relpath is None:
+            # workaround for posixpath bug in 2.6, doesn't generate correct
+            # relative path when *start* (second) parameter is root ('/')
+            if baseURI == "/":
+                relpath = self[1:]
+            else:
+                relpath = posixpath.relpath(self, baseURI)
+            relative_refs[baseURI] = relpath
         return relpath
 
     @property
@@ -111,6 +119,11 @@ class PackURI(str):
         rels_uri_str = posixpath.join(self.baseURI, "_rels", rels_filename)
         return PackURI(rels_uri_str)
 
+    @lazyproperty
+    def _relative_refs(self):
+        """dict {baseURI: relative_ref} caching results of `.relative_ref()`."""
+        return {}
+
 
 PACKAGE_URI = PackURI("/")
 CONTENT_TYPES_URI = PackURI("/[Content_Types].xml")
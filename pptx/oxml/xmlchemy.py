@@ -784,12 +784,15 @@ class _OxmlElementBase(etree.ElementBase):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str):
+    def xpath(self, xpath_str, **variables):
         """
         Override of ``lxml`` _Element.xpath() method to provide standard Open
-        XML namespace mapping in centralized location.
+        XML namespace mapping in centralized location. Any keyword arguments
+        are passed through as XPath variables, e.g. ``$rId``.
         """
-        return super(BaseOxmlElement, self).xpath(xpath_str, namespaces=_nsmap)
+        return super(BaseOxmlElement, self).xpath(
+            xpath_str, namespaces=_nsmap, **variables
+        )
 
 
 BaseOxmlElement = MetaOxmlElement(
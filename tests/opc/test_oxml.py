@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import pytest
 
+from pptx.exc import InvalidXmlError
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.oxml import (
     CT_Default,
@@ -13,11 +14,15 @@ from pptx.opc.oxml import (
     CT_Relationship,
     CT_Relationships,
     CT_Types,
+    iter_content_types,
     oxml_tostring,
     serialize_part_xml,
+    serialize_rels_xml,
 )
 from pptx.oxml import parse_xml
 
+from ..unitutil.file import snippet_bytes
+
 from .unitdata.rels import (
     a_Default,
     an_Override,
@@ -142,6 +147,81 @@ class DescribeCT_Types(object):
         assert types.xml == expected_types_xml
 
 
+class Describe_iter_content_types(object):
+    """Unit-test suite for `pptx.opc.oxml.iter_content_types` function."""
+
+    @pytest.mark.parametrize("to_text", (False, True))
+    def it_generates_the_content_type_items_in_the_xml(self, to_text):
+        content_types_xml = snippet_bytes("content-types-xml")
+        if to_text:
+            content_types_xml = content_types_xml.decode("utf-8")
+
+        items = list(iter_content_types(content_types_xml))
+
+        assert items == [
+            ("Default", "png", "image/png"),
+            (
+                "Default",
+                "rels",
+                "application/vnd.openxmlformats-package.relationships+xml",
+            ),
+            ("Default", "xml", "application/xml"),
+            ("Override", "/docProps/core.xml", "app/vnd.core"),
+            ("Override", "/ppt/slides/slide1.xml", "app/vnd.ct_sld"),
+            ("Override", "/zebra/foo.bar", "app/vnd.foobar"),
+        ]
+
+    @pytest.mark.parametrize(
+        "item_xml, attr_name, tag",
+        (
+            ('<Default ContentType="image/png"/>', "Extension", "Default"),
+            ('<Default Extension="png"/>', "ContentType", "Default"),
+            ('<Override ContentType="app/vnd.core"/>', "PartName", "Override"),
+            ('<Override PartName="/docProps/core.xml"/>', "ContentType", "Override"),
+        ),
+    )
+    def but_it_raises_on_a_missing_required_attribute(self, item_xml, attr_name, tag):
+        content_types_xml = (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-type'
+            's">%s</Types>' % item_xml
+        )
+
+        with pytest.raises(InvalidXmlError) as e:
+            list(iter_content_types(content_types_xml))
+
+        assert str(e.value) == (
+            "required '%s' attribute not present on element {http://schemas.openxml"
+            "formats.org/package/2006/content-types}%s" % (attr_name, tag)
+        )
+
+
+class Describe_serialize_rels_xml(object):
+    """Unit-test suite for `pptx.opc.oxml.serialize_rels_xml` function."""
+
+    @pytest.mark.parametrize(
+        "rel_items",
+        (
+            (),
+            (("rId1", "http://reltype1", "docProps/core.xml", False),),
+            (
+                ("rId1", "http://reltype1", "../slides/slide1.xml", False),
+                ("rId2", "http://linktype", "http://some/link?a=1&b=2", True),
+            ),
+            (("rId3", 'a<b>"c\'', "x\ty\nz\r fØØ ]]> &amp;", False),),
+        ),
+    )
+    def it_produces_the_same_xml_as_CT_Relationships(self, rel_items):
+        rels_elm = CT_Relationships.new()
+        for rId, reltype, target_ref, is_external in rel_items:
+            rels_elm.add_rel(rId, reltype, target_ref, is_external)
+
+        assert serialize_rels_xml(rel_items) == rels_elm.xml
+
+    def but_it_raises_like_lxml_on_a_character_XML_cannot_represent(self):
+        with pytest.raises(ValueError):
+            serialize_rels_xml((("rId1", "http://reltype", "foo\x01bar", False),))
+
+
 class Describe_serialize_part_xml(object):
     """Unit-test suite for `pptx.opc.oxml.serialize_part_xml` function."""
 
@@ -5,9 +5,11 @@
 import collections
 import io
 import itertools
+import sys
 
 import pytest
 
+from pptx.exc import InvalidXmlError
 from pptx.opc.constants import (
     CONTENT_TYPE as CT,
     RELATIONSHIP_TARGET_MODE as RTM,
@@ -38,8 +40,10 @@ from ..unitutil.mock import (
     function_mock,
     initializer_mock,
     instance_mock,
+    loose_mock,
     method_mock,
     property_mock,
+    var_mock,
 )
 
 
@@ -174,6 +178,24 @@ class DescribeOpcPackage(object):
 
         assert list(package.iter_parts()) == [part_, part_2_]
 
+    def it_reuses_its_parts_traversal_until_a_relationship_changes(self, request):
+        parts_ = tuple(
+            instance_mock(request, Part, name="part_%d" % i) for i in range(2)
+        )
+        _iter_parts_ = method_mock(
+            request, OpcPackage, "_iter_parts", side_effect=lambda _: iter(parts_)
+        )
+        package = OpcPackage(None)
+
+        assert tuple(package.iter_parts()) == parts_
+        assert tuple(package.iter_parts()) == parts_
+        assert _iter_parts_.call_count == 1
+
+        package.relate_to("http://url", RT.HYPERLINK, is_external=True)
+
+        assert tuple(package.iter_parts()) == parts_
+        assert _iter_parts_.call_count == 2
+
     def it_can_iterate_over_its_relationships(self, request, _rels_prop_):
         """
         +----------+          +--------+
@@ -221,6 +243,25 @@ class DescribeOpcPackage(object):
             rels[2],
         )
 
+    def it_reuses_its_rels_traversal_until_a_relationship_changes(self, request):
+        rels_ = tuple(
+            instance_mock(request, _Relationship, name="rel_%d" % i) for i in range(2)
+        )
+        _iter_rels_ = method_mock(
+            request, OpcPackage, "_iter_rels", side_effect=lambda _: iter(rels_)
+        )
+        package = OpcPackage(None)
+
+        assert tuple(package.iter_rels()) == rels_
+        assert tuple(package.iter_rels()) == rels_
+        assert _iter_rels_.call_count == 1
+
+        rId = package.relate_to("http://url", RT.HYPERLINK, is_external=True)
+        package.drop_rel(rId)
+
+        assert tuple(package.iter_rels()) == rels_
+        assert _iter_rels_.call_count == 2
+
     def it_provides_access_to_the_main_document_part(self, request):
         presentation_part_ = instance_mock(request, PresentationPart)
         part_related_by_ = method_mock(
@@ -256,6 +297,20 @@ class DescribeOpcPackage(object):
         PackURI_.assert_called_once_with(next_partname)
         assert partname == next_partname
 
+    def but_it_ignores_partnames_that_only_share_a_prefix_with_tmpl(self, request):
+        method_mock(
+            request,
+            OpcPackage,
+            "iter_parts",
+            return_value=(
+                instance_mock(request, Part, partname=PackURI(partname))
+                for partname in ("/x1.xml", "/x1a.xml", "/x2.xml.rels", "/x/x3.xml")
+            ),
+        )
+        package = OpcPackage(None)
+
+        assert package.next_partname("/x%d.xml") == "/x2.xml"
+
     def it_can_save_to_a_pkg_file(self, request, _rels_prop_, relationships_):
         _rels_prop_.return_value = relationships_
         parts_ = tuple(instance_mock(request, Part) for _ in range(3))
@@ -466,6 +521,13 @@ class DescribePart(object):
         part = Part(None, None, None, None)
         assert part._blob_from_file(io.BytesIO(b"012345")) == b"012345"
 
+    def and_it_loads_the_whole_blob_regardless_of_stream_position(self):
+        stream = io.BytesIO(b"012345")
+        stream.seek(4)
+        part = Part(None, None, None, None)
+
+        assert part._blob_from_file(stream) == b"012345"
+
     def it_constructs_its_relationships_object_to_help(self, request, relationships_):
         _Relationships_ = class_mock(
             request, "pptx.opc.package._Relationships", return_value=relationships_
@@ -518,6 +580,22 @@ class DescribeXmlPart(object):
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
+    @pytest.mark.parametrize(
+        "rId, expected_value", (("rId1", 2), ("rId2", 1), ("rId3", 0))
+    )
+    def it_can_count_the_references_to_an_rId_in_its_xml(self, rId, expected_value):
+        xml_part = XmlPart(
+            None,
+            None,
+            None,
+            element(
+                "p:sld/(a:hlinkClick{r:id=rId1},a:hlinkClick{r:id=rId2}"
+                ",p:cSld/a:hlinkClick{r:id=rId1})"
+            ),
+        )
+
+        assert xml_part._rel_ref_count(rId) == expected_value
+
     def it_knows_it_is_the_part_for_its_child_objects(self):
         xml_part = XmlPart(None, None, None, None)
         assert xml_part.part is xml_part
@@ -529,10 +607,14 @@ class DescribePartFactory(object):
     def it_constructs_custom_part_type_for_registered_content_types(
         self, request, package_, part_
     ):
-        SlidePart_ = class_mock(request, "pptx.opc.package.XmlPart")
+        SlidePart_ = loose_mock(request, name="SlidePart_")
         SlidePart_.load.return_value = part_
+        var_mock(
+            request,
+            "pptx.opc.package.PartFactory.part_type_for",
+            new={CT.PML_SLIDE: SlidePart_},
+        )
         partname = PackURI("/ppt/slides/slide7.xml")
-        PartFactory.part_type_for[CT.PML_SLIDE] = SlidePart_
 
         part = PartFactory(partname, CT.PML_SLIDE, package_, b"blob")
 
@@ -544,7 +626,7 @@ class DescribePartFactory(object):
     def it_constructs_part_using_default_class_when_no_custom_registered(
         self, request, package_, part_
     ):
-        Part_ = class_mock(request, "pptx.opc.package.Part")
+        Part_ = class_mock(request, "pptx.opc.package.Part", autospec=False)
         Part_.load.return_value = part_
         partname = PackURI("/bar/foo.xml")
 
@@ -617,6 +699,20 @@ class Describe_ContentTypeMap(object):
     ):
         assert content_type_map[PackURI(partname)] == expected_value
 
+    def it_interns_the_content_types_it_loads(self, content_type_map):
+        content_type = content_type_map[PackURI("/ppt/presentation.xml")]
+        # --- interning an equal but distinct str returns the already-interned one ---
+        assert sys.intern(content_type.encode("utf-8").decode("utf-8")) is content_type
+
+    def but_it_raises_InvalidXmlError_on_an_item_with_no_content_type(self):
+        content_types_xml = (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-ty'
+            'pes"><Default Extension="png"/></Types>'
+        )
+
+        with pytest.raises(InvalidXmlError):
+            _ContentTypeMap.from_xml(content_types_xml)
+
     def it_raises_KeyError_on_partname_not_found(self, content_type_map):
         with pytest.raises(KeyError) as e:
             content_type_map[PackURI("/!blat/rhumba.1x&")]
@@ -793,6 +889,31 @@ class Describe_Relationships(object):
 
         assert relationships._rels == {}
 
+    def but_it_leaves_the_mutation_token_unchanged_when_rId_is_not_present(
+        self, _rels_prop_
+    ):
+        _rels_prop_.return_value = {}
+        relationships = _Relationships(None)
+        mutation_token = _Relationships.mutation_token
+
+        with pytest.raises(KeyError):
+            relationships.pop("rId22")
+
+        assert _Relationships.mutation_token == mutation_token
+
+    def it_draws_a_fresh_mutation_token_on_each_change(self, request):
+        tokens = iter((41, 42))
+        var_mock(request, "pptx.opc.package._Relationships.mutation_token", new=0)
+        var_mock(
+            request, "pptx.opc.package._Relationships._mutation_tokens", new=tokens
+        )
+        relationships = _Relationships("/ppt")
+
+        rId = relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url")
+        assert _Relationships.mutation_token == 41
+        relationships.pop(rId)
+        assert _Relationships.mutation_token == 42
+
     def it_can_serialize_itself_to_XML(self, request, _rels_prop_):
         _rels_prop_.return_value = {
             "rId1": instance_mock(
@@ -943,6 +1064,21 @@ class Describe_Relationships(object):
         assert rels["rId4"] in rels_by_reltype[RT.HYPERLINK]
         assert rels_by_reltype[RT.CHART] == []
 
+    def and_it_keeps_that_collection_current_as_relationships_change(self, request):
+        slide_part_, image_part_ = (instance_mock(request, Part) for _ in range(2))
+        relationships = _Relationships("/ppt")
+        slide_rId = relationships.get_or_add(RT.SLIDE, slide_part_)
+        assert relationships.part_with_reltype(RT.SLIDE) is slide_part_
+
+        relationships.get_or_add(RT.IMAGE, image_part_)
+        assert relationships.part_with_reltype(RT.IMAGE) is image_part_
+        assert relationships.get_or_add(RT.SLIDE, slide_part_) == slide_rId
+
+        relationships.pop(slide_rId)
+        with pytest.raises(KeyError):
+            relationships.part_with_reltype(RT.SLIDE)
+        assert relationships.part_with_reltype(RT.IMAGE) is image_part_
+
     # fixture components -----------------------------------
 
     @pytest.fixture
@@ -1005,6 +1141,21 @@ class Describe_Relationship(object):
         )
         assert isinstance(relationship, _Relationship)
 
+    def and_it_interns_the_reltype_it_loads(self, part_):
+        rel_elm = parse_xml(
+            '<Relationship xmlns="http://schemas.openxmlformats.org/package/2006/relat'
+            'ionships" Id="rId42" Type="http://schemas.openxmlformats.org/officeDocumen'
+            't/2006/relationships/slide" Target="slides/slide7.xml"/>'
+        )
+
+        relationship = _Relationship.from_xml(
+            "/ppt", rel_elm, {"/ppt/slides/slide7.xml": part_}
+        )
+
+        reltype = relationship.reltype
+        assert reltype == RT.SLIDE
+        assert sys.intern(reltype.encode("utf-8").decode("utf-8")) is reltype
+
     @pytest.mark.parametrize(
         "target_mode, expected_value",
         ((RTM.INTERNAL, False), (RTM.EXTERNAL, True), (None, False)),
@@ -6,6 +6,8 @@ import pytest
 
 from pptx.opc.packuri import PackURI
 
+from ..unitutil.mock import function_mock
+
 
 class DescribePackURI(object):
     """Unit-test suite for the `pptx.opc.packuri.PackURI` objects."""
@@ -84,6 +86,26 @@ class DescribePackURI(object):
     def it_can_compute_its_relative_reference(self, uri, base_uri, expected_value):
         assert PackURI(uri).relative_ref(base_uri) == expected_value
 
+    def and_it_remembers_the_relative_reference_for_each_base_URI(self, request):
+        relpath_ = function_mock(
+            request,
+            "pptx.opc.packuri.posixpath.relpath",
+            return_value="../slideLayouts/slideLayout1.xml",
+        )
+        pack_uri = PackURI("/ppt/slideLayouts/slideLayout1.xml")
+
+        relative_ref = pack_uri.relative_ref("/ppt/slides")
+
+        assert pack_uri.relative_ref("/ppt/slides") is relative_ref
+        relpath_.assert_called_once_with(pack_uri, "/ppt/slides")
+        root_relative_ref = pack_uri.relative_ref("/")
+        assert root_relative_ref == "ppt/slideLayouts/slideLayout1.xml"
+        assert pack_uri.relative_ref("/") is root_relative_ref
+
+    def and_it_computes_its_baseURI_only_once(self):
+        pack_uri = PackURI("/ppt/slides/slide1.xml")
+        assert pack_uri.baseURI is pack_uri.baseURI
+
     @pytest.mark.parametrize(
         "uri, expected_value",
         (